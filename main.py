@@ -1,4 +1,6 @@
 import logging
+import discord
+from discord import app_commands
 from src.bot import VerificationBot
 from src.views import VerifyButton
 from src.config import Config
@@ -27,6 +29,27 @@ def main():
             ephemeral=True
         )
 
+    @bot.tree.command(name="profile_check", description="Profile the next holder status check")
+    @app_commands.default_permissions(administrator=True)
+    @app_commands.checks.has_permissions(administrator=True)
+    async def profile_check_command(interaction):
+        next_run = bot.request_profile()
+        when = discord.utils.format_dt(next_run, "R") if next_run else "on its next run"
+        await interaction.response.send_message(
+            f"The next holder status check ({when}) will be profiled and written to `{Config.PROFILE_DIR}`.",
+            ephemeral=True
+        )
+
+    @profile_check_command.error
+    async def profile_check_error(interaction, error):
+        if isinstance(error, app_commands.MissingPermissions):
+            await interaction.response.send_message(
+                "Only server administrators can profile holder status checks.",
+                ephemeral=True
+            )
+        else:
+            logger.error(f"Error in profile_check command: {error}", exc_info=error)
+
     try:
         bot.run(Config.BOT_TOKEN)
     except Exception as e:
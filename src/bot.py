@@ -3,7 +3,10 @@ from discord.ext import commands, tasks
 import aiohttp
 import asyncio
 import logging
+import os
+import time
 from .config import Config
+from .loop_health import LoopLagMonitor, SamplingProfiler
 from .views import VerifyButton
 from .redis_manager import RedisManager
 from .role_managers import NervapeCKBRoleManager, NervapeBTCManager
@@ -20,8 +23,13 @@ class VerificationBot(commands.Bot):
         self.session = None
         self.redis = RedisManager()
         self.role_managers = []
+        self.loop_monitor = None
+        self.profile_next_check = Config.PROFILE_SWEEP
 
     async def setup_hook(self):
+        if Config.LOOP_LAG_THRESHOLD > 0:
+            self.loop_monitor = LoopLagMonitor(Config.LOOP_LAG_THRESHOLD)
+            self.loop_monitor.start()
         await self.tree.sync()
         self.session = aiohttp.ClientSession()
         self.role_managers = [
@@ -106,8 +114,28 @@ class VerificationBot(commands.Bot):
             print(f"Error verifying chains for user {user}: {e}")
             return False
 
+    def request_profile(self):
+        """Profile the next holder status check and return when it is scheduled"""
+        self.profile_next_check = True
+        return self.check_addresses.next_iteration
+
     @tasks.loop(seconds=Config.CHECK_INTERVAL)
     async def check_addresses(self):
+        """Check verified addresses against API, profiling the run if requested"""
+        if not self.profile_next_check:
+            await self.run_address_check()
+            return
+
+        self.profile_next_check = False
+        path = os.path.join(Config.PROFILE_DIR, f"check_addresses-{int(time.time())}.collapsed")
+        try:
+            with SamplingProfiler(path, Config.PROFILE_SAMPLE_INTERVAL, focus="run_address_check") as profiler:
+                await self.run_address_check()
+            print(f"Wrote address check profile with {sum(profiler.samples.values())} samples to {path}")
+        except OSError as e:
+            print(f"Error writing address check profile: {e}")
+
+    async def run_address_check(self):
         """Check verified addresses against API"""
         try:
             # Get verified users from Redis
@@ -155,6 +183,8 @@ class VerificationBot(commands.Bot):
             print(f"Error in address check: {e}")
 
     async def close(self):
+        if self.loop_monitor:
+            self.loop_monitor.stop()
         if self.session:
             await self.session.close()
         await super().close()
@@ -30,6 +30,12 @@ class Config:
     REDIS_HOST = os.getenv('REDIS_HOST', 'redis')              # Redis server hostname/IP
     REDIS_KEY_PREFIX = os.getenv('REDIS_KEY_PREFIX', 'nervape')  # Namespace prefix for Redis keys
 
+    # Event loop diagnostics
+    LOOP_LAG_THRESHOLD = float(os.getenv('LOOP_LAG_THRESHOLD', '0.25'))  # Seconds of loop blocking before logging a stack trace (0 disables)
+    PROFILE_SWEEP = os.getenv('PROFILE_SWEEP', 'false').lower() in ('1', 'true', 'yes')  # Profile the first holder status check
+    PROFILE_DIR = os.getenv('PROFILE_DIR', 'profiles')                    # Directory for collapsed-stack profile files
+    PROFILE_SAMPLE_INTERVAL = float(os.getenv('PROFILE_SAMPLE_INTERVAL', '0.005'))  # Seconds between profiler samples
+
     # Message Configuration
     MESSAGE_TITLE = os.getenv('MESSAGE_TITLE', 'Thanks for being a Nervape Holder!')
     MESSAGE_DESCRIPTION = os.getenv(
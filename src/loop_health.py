@@ -0,0 +1,160 @@
+import asyncio
+import collections
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+
+logger = logging.getLogger(__name__)
+
+
+def _loop_thread_frame(thread_id: int):
+    """Return the current frame of the given thread, if it is still alive"""
+    return sys._current_frames().get(thread_id)
+
+
+class LoopLagMonitor:
+    """Detect callbacks that block the event loop and log what they were doing.
+
+    A heartbeat task on the loop pushes a deadline forward every ``interval``
+    seconds. A watchdog thread compares that deadline with the clock; once the
+    loop overshoots it by more than ``threshold`` the loop thread's stack is
+    logged while it is still stuck, so the blocking call shows up in the trace.
+
+    A stall therefore logs two warnings on purpose: the watchdog's, which says
+    where the loop is stuck, and the heartbeat's once the loop recovers, which
+    says how long the stall lasted in total.
+    """
+
+    def __init__(self, threshold: float, interval: float = None):
+        self.threshold = threshold
+        self.interval = interval if interval is not None else threshold / 2
+        self._deadline = None
+        self._reported_deadline = None
+        self._loop_thread_id = None
+        self._heartbeat = None
+        self._watchdog = None
+        self._stopped = None
+
+    def start(self):
+        """Start monitoring the running loop; must be called from inside it"""
+        if self._heartbeat:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._deadline = time.monotonic() + self.interval
+        self._stopped = threading.Event()
+        self._heartbeat = asyncio.get_running_loop().create_task(self._beat())
+        self._watchdog = threading.Thread(
+            target=self._watch, args=(self._stopped,), name="loop-lag-watchdog", daemon=True
+        )
+        self._watchdog.start()
+        logger.info(f"Event loop lag monitor started (threshold {self.threshold:.3f}s)")
+
+    def stop(self):
+        """Stop monitoring; the watchdog thread exits on its next wake-up"""
+        if self._stopped:
+            self._stopped.set()
+        if self._heartbeat:
+            self._heartbeat.cancel()
+            self._heartbeat = None
+        self._watchdog = None
+
+    async def _beat(self):
+        while True:
+            self._deadline = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = time.monotonic() - self._deadline
+            if lag > self.threshold:
+                logger.warning(f"Event loop was blocked for {lag:.3f}s")
+
+    def _watch(self, stopped: threading.Event):
+        while not stopped.wait(self.interval):
+            deadline = self._deadline
+            lag = time.monotonic() - deadline
+            if lag <= self.threshold or deadline == self._reported_deadline:
+                continue
+            # Report each stall once, while the offending code is still on the stack
+            self._reported_deadline = deadline
+            frame = _loop_thread_frame(self._loop_thread_id)
+            if frame is None:
+                continue
+            stack = "".join(traceback.format_stack(frame))
+            logger.warning(
+                f"Event loop blocked for more than {lag:.3f}s, loop thread is at:\n{stack}"
+            )
+
+
+class SamplingProfiler:
+    """Sample the event loop thread's stack and write it as collapsed stacks.
+
+    The output uses the ``frame;frame;frame count`` format understood by
+    flamegraph.pl, speedscope and inferno. Sampling runs on a separate thread,
+    so time spent blocked inside the loop is captured as well.
+
+    When ``focus`` names a function, only samples taken while that function is
+    on the loop thread's stack keep their frames, rooted at the focus frame.
+    Because a suspended coroutine is not on the stack, that is the time the
+    focused code actually spent running or blocking the loop, not the time it
+    spent awaiting I/O. All other samples are folded into an ``[idle]`` root
+    when the loop was waiting for events, or ``[other loop activity]`` for
+    whatever else ran in the meantime.
+    """
+
+    IDLE = "[idle]"
+    OTHER = "[other loop activity]"
+
+    def __init__(self, path: str, interval: float = 0.005, focus: str = None):
+        self.path = path
+        self.interval = interval
+        self.focus = focus
+        self.samples = collections.Counter()
+        self._thread_id = None
+        self._sampler = None
+        self._stopped = threading.Event()
+
+    def __enter__(self):
+        self._thread_id = threading.get_ident()
+        self._stopped.clear()
+        self._sampler = threading.Thread(target=self._sample, name="sweep-profiler", daemon=True)
+        self._sampler.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._stopped.set()
+        self._sampler.join()
+        self.write()
+        return False
+
+    def _sample(self):
+        while not self._stopped.wait(self.interval):
+            frame = _loop_thread_frame(self._thread_id)
+            if frame is None:
+                continue
+            self.samples[self._collapse(frame)] += 1
+
+    def _collapse(self, frame) -> str:
+        """Turn the stack ending at ``frame`` into a root-first collapsed line"""
+        top = frame.f_code
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            stack.append(f"{code.co_name} ({code.co_filename}:{frame.f_lineno})")
+            if self.focus and code.co_name == self.focus:
+                return ";".join(reversed(stack))
+            frame = frame.f_back
+
+        if not self.focus:
+            return ";".join(reversed(stack))
+        if top.co_name == "select" and os.path.basename(top.co_filename) == "selectors.py":
+            return self.IDLE
+        return ";".join([self.OTHER] + stack[::-1])
+
+    def write(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            for stack, count in self.samples.most_common():
+                f.write(f"{stack} {count}\n")
@@ -0,0 +1,44 @@
+import pytest
+from unittest.mock import AsyncMock, patch
+from src.bot import VerificationBot
+from src.config import Config
+
+@pytest.fixture
+def bot():
+    return VerificationBot()
+
+@pytest.mark.asyncio
+async def test_check_addresses_without_profiling(bot, tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, "PROFILE_DIR", str(tmp_path))
+    bot.profile_next_check = False
+    with patch.object(bot, "run_address_check", AsyncMock()) as run:
+        await bot.check_addresses()
+
+    run.assert_awaited_once()
+    assert not list(tmp_path.iterdir())
+
+@pytest.mark.asyncio
+async def test_check_addresses_profiles_one_run(bot, tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, "PROFILE_DIR", str(tmp_path))
+    bot.request_profile()
+    with patch.object(bot, "run_address_check", AsyncMock()) as run:
+        await bot.check_addresses()
+        await bot.check_addresses()
+
+    assert run.await_count == 2
+    assert not bot.profile_next_check
+    profiles = list(tmp_path.iterdir())
+    assert len(profiles) == 1
+    assert profiles[0].name.startswith("check_addresses-")
+
+@pytest.mark.asyncio
+async def test_check_addresses_survives_profile_write_error(bot, tmp_path, monkeypatch):
+    blocker = tmp_path / "not_a_directory"
+    blocker.write_text("")
+    monkeypatch.setattr(Config, "PROFILE_DIR", str(blocker))
+    bot.request_profile()
+    with patch.object(bot, "run_address_check", AsyncMock()) as run:
+        await bot.check_addresses()
+
+    run.assert_awaited_once()
+    assert not bot.profile_next_check
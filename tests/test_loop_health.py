@@ -0,0 +1,60 @@
+import asyncio
+import logging
+import time
+import pytest
+from src.loop_health import LoopLagMonitor, SamplingProfiler
+
+def blocking_call():
+    time.sleep(0.3)
+
+@pytest.mark.asyncio
+async def test_lag_monitor_logs_blocking_stack(caplog):
+    monitor = LoopLagMonitor(threshold=0.1, interval=0.02)
+    with caplog.at_level(logging.WARNING, logger="src.loop_health"):
+        monitor.start()
+        await asyncio.sleep(0.05)
+        blocking_call()
+        await asyncio.sleep(0.05)
+        monitor.stop()
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert any("blocking_call" in message for message in messages)
+    assert any("Event loop was blocked" in message for message in messages)
+
+@pytest.mark.asyncio
+async def test_lag_monitor_quiet_when_loop_is_idle(caplog):
+    monitor = LoopLagMonitor(threshold=0.5, interval=0.02)
+    with caplog.at_level(logging.WARNING, logger="src.loop_health"):
+        monitor.start()
+        await asyncio.sleep(0.1)
+        monitor.stop()
+
+    assert not any("loop thread is at" in record.getMessage() for record in caplog.records)
+
+def test_sampling_profiler_writes_collapsed_stacks(tmp_path):
+    path = tmp_path / "profiles" / "check.collapsed"
+    with SamplingProfiler(str(path), interval=0.005) as profiler:
+        blocking_call()
+
+    assert sum(profiler.samples.values()) > 0
+    lines = path.read_text().splitlines()
+    assert lines
+    stack, count = lines[0].rsplit(" ", 1)
+    assert int(count) > 0
+    assert any("blocking_call" in line for line in lines)
+
+async def focused_check():
+    blocking_call()
+    await asyncio.sleep(0.1)
+
+@pytest.mark.asyncio
+async def test_sampling_profiler_focus_separates_other_activity(tmp_path):
+    path = tmp_path / "check.collapsed"
+    with SamplingProfiler(str(path), interval=0.005, focus="focused_check") as profiler:
+        await focused_check()
+
+    focused = [stack for stack in profiler.samples if stack.startswith("focused_check ")]
+    assert any("blocking_call" in stack for stack in focused)
+    assert SamplingProfiler.IDLE in profiler.samples
+    for stack in profiler.samples:
+        assert stack in focused or stack.split(";")[0] in (SamplingProfiler.IDLE, SamplingProfiler.OTHER)